@@ -0,0 +1,190 @@
+"""Online SQLite snapshots and restore.
+
+CLI:
+    python -m app.core.backup backup [--out PATH] [--compress] [--pages N] [--pause S]
+    python -m app.core.backup restore SNAPSHOT [--force]
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.database import DB_DIR, DB_PATH
+
+BACKUP_DIR = Path(os.getenv("BACKUP_DIR", str(DB_DIR / "backups")))
+SEED_SNAPSHOT = os.getenv("SEED_SNAPSHOT")
+
+BACKUP_STEP_PAGES = 256
+BACKUP_STEP_PAUSE_SECONDS = 0.005
+BACKUP_TIMEOUT_SECONDS = 600.0
+BACKUP_MAX_RESTARTS = 20
+
+# Held for the duration of a backup so admin requests cannot start overlapping ones.
+backup_lock = threading.Lock()
+
+
+@dataclass
+class BackupStats:
+    path: str
+    pages: int = 0
+    size_bytes: int = 0
+    compressed: bool = False
+    restarts: int = 0
+    duration_ms: float = 0.0
+
+
+def snapshot_path(compress: bool) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    suffix = ".sqlite.gz" if compress else ".sqlite"
+    return BACKUP_DIR / f"app-{stamp}{suffix}"
+
+
+def backup_database(
+    source: sqlite3.Connection,
+    target: Path,
+    compress: bool = False,
+    pages: int = BACKUP_STEP_PAGES,
+    pause: float = BACKUP_STEP_PAUSE_SECONDS,
+    timeout: float = BACKUP_TIMEOUT_SECONDS,
+    max_restarts: int = BACKUP_MAX_RESTARTS,
+) -> BackupStats:
+    """Copy a live database with the SQLite backup API, `pages` pages per step.
+
+    The source is only locked while a step runs, so API readers and writers
+    interleave with the copy; `pause` throttles between steps. A write through
+    another connection makes SQLite start the copy over, so the backup gives up
+    after `max_restarts` restarts or `timeout` seconds. The snapshot is written
+    to a temporary file and renamed into place once complete; temporary files
+    are removed if anything fails.
+    """
+    start = time.perf_counter()
+    stats = BackupStats(path=str(target), compressed=compress)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    raw = target.with_name(target.name + ".raw.tmp")
+    packed = target.with_name(target.name + ".tmp")
+    last_remaining = None
+
+    def progress(_status: int, remaining: int, _total: int) -> None:
+        nonlocal last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            stats.restarts += 1
+            if stats.restarts > max_restarts:
+                raise RuntimeError(f"backup restarted {stats.restarts} times, giving up")
+        last_remaining = remaining
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError(f"backup did not finish within {timeout} s")
+        if remaining and pause:
+            time.sleep(pause)
+
+    try:
+        dest = sqlite3.connect(raw)
+        try:
+            source.backup(dest, pages=pages, progress=progress)
+            stats.pages = dest.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            dest.close()
+
+        if compress:
+            with raw.open("rb") as src, gzip.open(packed, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            raw.unlink()
+            packed.replace(target)
+        else:
+            raw.replace(target)
+    except BaseException:
+        raw.unlink(missing_ok=True)
+        packed.unlink(missing_ok=True)
+        raise
+
+    stats.size_bytes = target.stat().st_size
+    stats.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    return stats
+
+
+def run_backup(target: Path, compress: bool = False, **options) -> BackupStats:
+    """Back up the application database through a dedicated connection."""
+    source = sqlite3.connect(DB_PATH)
+    try:
+        return backup_database(source, target, compress=compress, **options)
+    finally:
+        source.close()
+
+
+def restore_database(snapshot: Path, target: Path = DB_PATH, force: bool = False) -> int:
+    """Load a snapshot (plain or .gz) into `target`; returns the number of pages copied.
+
+    Meant for a fresh instance: refuses to overwrite an existing database unless `force`.
+    The snapshot is opened read-only, so a wrong path fails instead of restoring an
+    empty database.
+    """
+    if not snapshot.is_file():
+        raise FileNotFoundError(f"snapshot {snapshot} does not exist")
+    if target.exists() and target.stat().st_size > 0 and not force:
+        raise FileExistsError(f"{target} already exists, pass force=True to overwrite")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    unpacked = None
+    try:
+        if snapshot.suffix == ".gz":
+            unpacked = target.with_name(target.name + ".restore.tmp")
+            with gzip.open(snapshot, "rb") as src, unpacked.open("wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+        source = (unpacked or snapshot).resolve()
+        src = sqlite3.connect(f"{source.as_uri()}?mode=ro", uri=True)
+        try:
+            if src.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+                raise ValueError(f"{snapshot} failed integrity check")
+            pages = src.execute("PRAGMA page_count").fetchone()[0]
+            dest = sqlite3.connect(target)
+            try:
+                src.backup(dest)
+            finally:
+                dest.close()
+        finally:
+            src.close()
+    finally:
+        if unpacked is not None:
+            unpacked.unlink(missing_ok=True)
+    return pages
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.core.backup")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backup = commands.add_parser("backup", help="write an online snapshot of the database")
+    backup.add_argument("--out", type=Path, default=None)
+    backup.add_argument("--compress", action="store_true")
+    backup.add_argument("--pages", type=int, default=BACKUP_STEP_PAGES)
+    backup.add_argument("--pause", type=float, default=BACKUP_STEP_PAUSE_SECONDS)
+
+    restore = commands.add_parser("restore", help="load a snapshot into the database")
+    restore.add_argument("snapshot", type=Path)
+    restore.add_argument("--force", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.command == "backup":
+        stats = run_backup(
+            args.out or snapshot_path(args.compress),
+            compress=args.compress,
+            pages=args.pages,
+            pause=args.pause,
+        )
+        print(
+            f"{stats.path}: {stats.pages} pages, {stats.size_bytes} bytes in {stats.duration_ms} ms"
+        )
+    else:
+        pages = restore_database(args.snapshot, force=args.force)
+        print(f"restored {pages} pages into {DB_PATH}")
+
+
+if __name__ == "__main__":
+    main()
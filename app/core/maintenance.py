@@ -0,0 +1,256 @@
+"""Archival of stale wishes and SQLite compaction.
+
+CLI:
+    python -m app.core.maintenance migrate
+    python -m app.core.maintenance enable-incremental-vacuum
+    python -m app.core.maintenance run
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, and_, delete, exists, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.price_index import get_price_index
+from app.core.title_index import get_title_index
+from app.database import SessionLocal, engine, init_db
+from app.models import ArchivedWishORM, WishORM
+
+MAINTENANCE_ENABLED = os.getenv("MAINTENANCE_ENABLED", "0") == "1"
+MAINTENANCE_INTERVAL_SECONDS = int(os.getenv("MAINTENANCE_INTERVAL_SECONDS", "3600"))
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "365"))
+
+ARCHIVE_BATCH_SIZE = 500
+VACUUM_STEP_PAGES = 256
+VACUUM_STEP_PAUSE_SECONDS = 0.01
+
+logger = logging.getLogger("app.maintenance")
+
+
+@dataclass
+class MaintenanceStats:
+    archived: int = 0
+    freed_pages: int = 0
+    reclaimed_bytes: int = 0
+    duration_ms: float = 0.0
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def archive_stale(db: Session, older_than: timedelta) -> list[int]:
+    """Move wishes not updated for `older_than` into the archive table.
+
+    Works in small batches so each write transaction stays short. Each batch
+    is a single `DELETE ... RETURNING` that re-checks staleness, and exactly the
+    returned rows are inserted into the archive in the same transaction, so a
+    wish edited after its id was picked stays live. A live wish whose id is
+    already taken in the archive (ids reused before `migrate_wishes_table`) is
+    left in place and reported instead of failing the whole run.
+
+    Returns the ids that were actually moved.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = _timestamp(now - older_than)
+    archived_at = _timestamp(now)
+    archived: list[int] = []
+
+    wishes = WishORM.__table__
+    is_stale = and_(wishes.c.updated_at.isnot(None), wishes.c.updated_at < cutoff)
+    taken = exists().where(ArchivedWishORM.id == wishes.c.id)
+
+    collisions = db.execute(
+        select(func.count()).select_from(wishes).where(is_stale, taken)
+    ).scalar_one()
+    if collisions:
+        logger.warning("archive_id_collision", extra={"count": collisions})
+
+    while True:
+        ids = (
+            db.execute(select(wishes.c.id).where(is_stale, ~taken).limit(ARCHIVE_BATCH_SIZE))
+            .scalars()
+            .all()
+        )
+        if not ids:
+            return archived
+
+        moved = db.execute(
+            delete(wishes).where(wishes.c.id.in_(ids), is_stale, ~taken).returning(*wishes.c)
+        ).all()
+        if moved:
+            db.execute(
+                insert(ArchivedWishORM.__table__),
+                [{**row._mapping, "archived_at": archived_at} for row in moved],
+            )
+        db.commit()
+        archived.extend(row.id for row in moved)
+
+
+def migrate_wishes_table(bind: Engine) -> bool:
+    """One-time rebuild of a pre-archive `wishes` table; returns True if it ran.
+
+    Tables created before archival existed lack AUTOINCREMENT, so SQLite hands
+    out the id of an archived wish again, and lack the `updated_at` index the
+    archival scan uses. The rebuild copies rows into the current schema and
+    starts the id sequence past every live and archived id.
+    """
+    if bind.dialect.name != "sqlite":
+        for index in WishORM.__table__.indexes:
+            index.create(bind, checkfirst=True)
+        return False
+
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        ddl = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'wishes'"
+        ).scalar()
+        if ddl is None or "AUTOINCREMENT" in ddl.upper():
+            return False
+
+        columns = ", ".join(column.name for column in WishORM.__table__.columns)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            conn.exec_driver_sql("ALTER TABLE wishes RENAME TO wishes_old")
+            old_indexes = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'index' AND tbl_name = 'wishes_old' AND sql IS NOT NULL"
+            ).scalars()
+            for name in list(old_indexes):
+                conn.exec_driver_sql(f'DROP INDEX "{name}"')
+            WishORM.__table__.create(conn)
+            # Column names come from the model, not from input.
+            conn.exec_driver_sql(
+                f"INSERT INTO wishes ({columns}) SELECT {columns} FROM wishes_old"  # nosec B608
+            )
+            conn.exec_driver_sql("DROP TABLE wishes_old")
+            conn.exec_driver_sql("DELETE FROM sqlite_sequence WHERE name = 'wishes'")
+            conn.exec_driver_sql(
+                "INSERT INTO sqlite_sequence (name, seq) SELECT 'wishes', max("
+                "(SELECT coalesce(max(id), 0) FROM wishes), "
+                "(SELECT coalesce(max(id), 0) FROM wishes_archive))"
+            )
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+    logger.info("wishes_table_migrated")
+    return True
+
+
+def enable_incremental_vacuum(bind: Engine) -> None:
+    """Switch an existing SQLite file to auto_vacuum=INCREMENTAL.
+
+    New files get the setting from `init_db`. An existing file needs one full
+    VACUUM: it locks the database for its duration and temporarily needs about
+    twice the file size on disk, so it is a manual step rather than part of
+    startup.
+    """
+    if bind.dialect.name != "sqlite":
+        return
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:
+            return
+        conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+
+
+def compact(bind: Engine) -> MaintenanceStats:
+    """Release free pages with incremental VACUUM and refresh planner stats."""
+    stats = MaintenanceStats()
+    if bind.dialect.name != "sqlite":
+        with bind.connect() as conn:
+            conn.exec_driver_sql("ANALYZE")
+            conn.commit()
+        return stats
+
+    raw = bind.raw_connection()
+    try:
+        conn = raw.driver_connection
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        remaining = before
+        if before and conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # See enable_incremental_vacuum; until then free pages stay in the file.
+            logger.warning("incremental_vacuum_disabled", extra={"free_pages": before})
+            before = remaining = 0
+        while remaining > 0:
+            # executescript steps the pragma to completion, execute() frees a single page.
+            conn.executescript(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES});")
+            left = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if left >= remaining:
+                break
+            remaining = left
+            time.sleep(VACUUM_STEP_PAUSE_SECONDS)
+        conn.executescript("ANALYZE;")
+    finally:
+        raw.close()
+
+    stats.freed_pages = before - remaining
+    stats.reclaimed_bytes = stats.freed_pages * page_size
+    return stats
+
+
+def run_maintenance(older_than: timedelta) -> MaintenanceStats:
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        archived = archive_stale(db, older_than)
+
+    for index in (get_price_index(), get_title_index()):
+        if index is not None:
+            for wish_id in archived:
+                index.discard(wish_id)
+
+    stats = compact(engine)
+    stats.archived = len(archived)
+    stats.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    logger.info(
+        "maintenance_completed",
+        extra={
+            "archived": stats.archived,
+            "freed_pages": stats.freed_pages,
+            "reclaimed_bytes": stats.reclaimed_bytes,
+            "duration_ms": stats.duration_ms,
+        },
+    )
+    return stats
+
+
+async def maintenance_loop() -> None:
+    older_than = timedelta(days=ARCHIVE_AFTER_DAYS)
+    while True:
+        await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(run_maintenance, older_than)
+        except Exception:
+            logger.exception("maintenance_failed")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.core.maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("migrate", help="rebuild a pre-archive wishes table")
+    commands.add_parser(
+        "enable-incremental-vacuum", help="one-time full VACUUM into auto_vacuum=INCREMENTAL"
+    )
+    commands.add_parser("run", help="run one archival + compaction cycle now")
+
+    args = parser.parse_args(argv)
+    init_db()
+    if args.command == "migrate":
+        print("migrated" if migrate_wishes_table(engine) else "already up to date")
+    elif args.command == "enable-incremental-vacuum":
+        enable_incremental_vacuum(engine)
+        print("auto_vacuum = INCREMENTAL")
+    else:
+        print(run_maintenance(timedelta(days=ARCHIVE_AFTER_DAYS)))
+
+
+if __name__ == "__main__":
+    main()
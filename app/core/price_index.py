@@ -0,0 +1,108 @@
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from decimal import ROUND_CEILING, Decimal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import WishORM
+
+PRICE_INDEX_ENABLED = os.getenv("PRICE_INDEX_ENABLED", "0") == "1"
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def _to_cents(price: Decimal) -> int:
+    cents = int((Decimal(str(price)) * 100).to_integral_value(rounding=ROUND_CEILING))
+    return max(_INT64_MIN, min(_INT64_MAX, cents))
+
+
+class PriceIndex:
+    """Sorted (price, id) read model for `price<` queries.
+
+    Prices are kept as integer cents in a compact array alongside a parallel
+    array of wish ids, ordered by (price, id). Wishes without a price are not
+    indexed, matching the SQL filter.
+
+    Write handlers call `sync` after their commit. It re-reads the committed
+    price while holding the index lock, so concurrent writes to one wish always
+    leave the index at the latest committed value, whatever order they arrive in.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._prices = array("q")
+        self._ids = array("q")
+        self._by_id: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def rebuild(self, db: Session) -> None:
+        rows = db.execute(
+            select(WishORM.id, WishORM.price_estimate).where(WishORM.price_estimate.isnot(None))
+        ).all()
+        pairs = sorted((_to_cents(price), wish_id) for wish_id, price in rows)
+
+        with self._lock:
+            self._prices = array("q", (cents for cents, _ in pairs))
+            self._ids = array("q", (wish_id for _, wish_id in pairs))
+            self._by_id = {wish_id: cents for cents, wish_id in pairs}
+
+    def upsert(self, wish_id: int, price: Decimal | None) -> None:
+        with self._lock:
+            self._set(wish_id, price)
+
+    def sync(self, db: Session, wish_id: int) -> None:
+        """Bring one wish in line with its committed row (absent row = discard)."""
+        with self._lock:
+            price = db.execute(
+                select(WishORM.price_estimate).where(WishORM.id == wish_id)
+            ).scalar_one_or_none()
+            self._set(wish_id, price)
+
+    def discard(self, wish_id: int) -> None:
+        with self._lock:
+            self._remove(wish_id)
+
+    def ids_below(self, price_lt: Decimal, limit: int | None = None) -> list[int]:
+        """Ids of wishes with price < `price_lt`, cheapest first."""
+        bound = _to_cents(price_lt)
+        with self._lock:
+            end = bisect_left(self._prices, bound)
+            if limit is not None:
+                end = min(end, limit)
+            return self._ids[:end].tolist()
+
+    def _position(self, cents: int, wish_id: int) -> int:
+        lo = bisect_left(self._prices, cents)
+        hi = bisect_left(self._prices, cents + 1, lo)
+        return bisect_left(self._ids, wish_id, lo, hi)
+
+    def _set(self, wish_id: int, price: Decimal | None) -> None:
+        self._remove(wish_id)
+        if price is None:
+            return
+        cents = _to_cents(price)
+        pos = self._position(cents, wish_id)
+        self._prices.insert(pos, cents)
+        self._ids.insert(pos, wish_id)
+        self._by_id[wish_id] = cents
+
+    def _remove(self, wish_id: int) -> None:
+        cents = self._by_id.pop(wish_id, None)
+        if cents is None:
+            return
+        pos = self._position(cents, wish_id)
+        del self._prices[pos]
+        del self._ids[pos]
+
+
+price_index = PriceIndex()
+
+
+def get_price_index() -> PriceIndex | None:
+    return price_index if PRICE_INDEX_ENABLED else None
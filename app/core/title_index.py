@@ -0,0 +1,85 @@
+import os
+import threading
+from bisect import bisect_left, insort
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import WishORM
+
+TITLE_INDEX_ENABLED = os.getenv("TITLE_INDEX_ENABLED", "0") == "1"
+
+
+class TitleIndex:
+    """Sorted (lowercased title, id) read model for prefix suggestions.
+
+    A prefix maps to one contiguous run of the sorted list, so a lookup is a
+    bisect plus a scan of at most `limit` entries. Titles are folded with
+    `str.lower`, the same rule the SQL fallback applies via `unicode_lower`.
+    Like PriceIndex, write handlers call `sync` to apply the committed row.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: list[tuple[str, int]] = []
+        self._titles: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, db: Session) -> None:
+        rows = db.execute(select(WishORM.id, WishORM.title)).all()
+        entries = sorted((title.lower(), wish_id) for wish_id, title in rows)
+
+        with self._lock:
+            self._entries = entries
+            self._titles = {wish_id: title for wish_id, title in rows}
+
+    def upsert(self, wish_id: int, title: str) -> None:
+        with self._lock:
+            self._set(wish_id, title)
+
+    def sync(self, db: Session, wish_id: int) -> None:
+        """Bring one wish in line with its committed row (absent row = discard)."""
+        with self._lock:
+            title = db.execute(
+                select(WishORM.title).where(WishORM.id == wish_id)
+            ).scalar_one_or_none()
+            self._set(wish_id, title)
+
+    def discard(self, wish_id: int) -> None:
+        with self._lock:
+            self._remove(wish_id)
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[int, str]]:
+        """Up to `limit` (id, title) pairs whose title starts with `prefix`, A-Z."""
+        key = prefix.lower()
+        result = []
+        with self._lock:
+            pos = bisect_left(self._entries, (key,))
+            for title_key, wish_id in self._entries[pos : pos + limit]:
+                if not title_key.startswith(key):
+                    break
+                result.append((wish_id, self._titles[wish_id]))
+        return result
+
+    def _set(self, wish_id: int, title: str | None) -> None:
+        self._remove(wish_id)
+        if title is None:
+            return
+        insort(self._entries, (title.lower(), wish_id))
+        self._titles[wish_id] = title
+
+    def _remove(self, wish_id: int) -> None:
+        title = self._titles.pop(wish_id, None)
+        if title is None:
+            return
+        pos = bisect_left(self._entries, (title.lower(), wish_id))
+        del self._entries[pos]
+
+
+title_index = TitleIndex()
+
+
+def get_title_index() -> TitleIndex | None:
+    return title_index if TITLE_INDEX_ENABLED else None
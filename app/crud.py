@@ -0,0 +1,30 @@
+from sqlalchemy import Row, bindparam, delete, insert, update
+from sqlalchemy.orm import Session
+
+from app.models import WishORM
+
+wishes = WishORM.__table__
+
+# Built once at import: the compiled form of each statement is then reused from
+# SQLAlchemy's compiled cache (keyed per set of supplied columns for UPDATE).
+_INSERT_WISH = insert(wishes).returning(*wishes.c)
+_UPDATE_WISH = update(wishes).where(wishes.c.id == bindparam("wish_id")).returning(*wishes.c)
+_DELETE_WISH = delete(wishes).where(wishes.c.id == bindparam("wish_id")).returning(wishes.c.id)
+
+
+def insert_wish(db: Session, values: dict) -> Row:
+    wish = db.execute(_INSERT_WISH, values).one()
+    db.commit()
+    return wish
+
+
+def update_wish(db: Session, wish_id: int, values: dict) -> Row | None:
+    wish = db.execute(_UPDATE_WISH, {"wish_id": wish_id, **values}).first()
+    db.commit()
+    return wish
+
+
+def delete_wish(db: Session, wish_id: int) -> bool:
+    deleted = db.execute(_DELETE_WISH, {"wish_id": wish_id}).first()
+    db.commit()
+    return deleted is not None
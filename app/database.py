@@ -1,13 +1,17 @@
+import sqlite3
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, String, create_engine, event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.sql.functions import GenericFunction
 
 BASE_DIR = Path.cwd()
 DB_DIR = BASE_DIR / "db"
 DB_DIR.mkdir(parents=True, exist_ok=True)
 
-DB_URL = f"sqlite:///{DB_DIR / 'app.sqlite'}"
+DB_PATH = DB_DIR / "app.sqlite"
+DB_URL = f"sqlite:///{DB_PATH}"
 
 engine = create_engine(DB_URL, connect_args={"check_same_thread": False})
 
@@ -16,6 +20,32 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+class unicode_lower(GenericFunction):
+    """lower() that folds non-ASCII letters on SQLite as well, like `str.lower`."""
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(unicode_lower)
+def _compile_unicode_lower(element, compiler, **kw):
+    return f"lower({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(unicode_lower, "sqlite")
+def _compile_unicode_lower_sqlite(element, compiler, **kw):
+    # SQLite's built-in lower() only folds ASCII.
+    return f"unicode_lower({compiler.process(element.clauses, **kw)})"
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, _connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function(
+            "unicode_lower", 1, lambda v: v.lower() if v is not None else None, deterministic=True
+        )
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -24,7 +54,19 @@ def get_db():
         db.close()
 
 
-def init_db():
+def init_db(bind=engine):
     from app import models  # noqa: F401
 
-    Base.metadata.create_all(bind=engine)
+    _set_incremental_vacuum_on_new_file(bind)
+    Base.metadata.create_all(bind=bind)
+
+
+def _set_incremental_vacuum_on_new_file(bind):
+    # auto_vacuum can be changed without a VACUUM only before the first table
+    # exists; existing files go through `python -m app.core.maintenance
+    # enable-incremental-vacuum`.
+    if bind.dialect.name != "sqlite":
+        return
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if conn.exec_driver_sql("SELECT count(*) FROM sqlite_master").scalar() == 0:
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
@@ -1,23 +1,45 @@
+import asyncio
+import contextlib
 import logging
 import time
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from app.core.backup import SEED_SNAPSHOT, restore_database
 from app.core.context import get_cid, set_cid
 from app.core.errors import ApiError
-from app.database import init_db
+from app.core.maintenance import MAINTENANCE_ENABLED, maintenance_loop, migrate_wishes_table
+from app.core.price_index import PRICE_INDEX_ENABLED, price_index
+from app.core.title_index import TITLE_INDEX_ENABLED, title_index
+from app.database import DB_PATH, SessionLocal, engine, init_db
+from app.routers.admin import router as admin_router
 from app.routers.wishes import router as wishes_router
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if SEED_SNAPSHOT and not DB_PATH.exists():
+        restore_database(Path(SEED_SNAPSHOT))
     init_db()
+    if MAINTENANCE_ENABLED:
+        migrate_wishes_table(engine)
+    with SessionLocal() as db:
+        if PRICE_INDEX_ENABLED:
+            price_index.rebuild(db)
+        if TITLE_INDEX_ENABLED:
+            title_index.rebuild(db)
+    maintenance = asyncio.create_task(maintenance_loop()) if MAINTENANCE_ENABLED else None
     yield
+    if maintenance is not None:
+        maintenance.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await maintenance
 
 
 app = FastAPI(title="SecDev Course App", version="0.1.0", lifespan=lifespan)
@@ -176,3 +198,4 @@ def health():
 
 
 app.include_router(wishes_router)
+app.include_router(admin_router)
@@ -5,10 +5,23 @@ from app.database import Base
 
 class WishORM(Base):
     __tablename__ = "wishes"
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(50), nullable=False)
     link = Column(String, nullable=True)
     price_estimate = Column(Numeric(10, 2), nullable=True)
+    updated_at = Column(String, nullable=True, index=True)
+    notes = Column(Text, nullable=True)
+
+
+class ArchivedWishORM(Base):
+    __tablename__ = "wishes_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(50), nullable=False)
+    link = Column(String, nullable=True)
+    price_estimate = Column(Numeric(10, 2), nullable=True)
     updated_at = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
+    archived_at = Column(String, nullable=False)
@@ -0,0 +1,65 @@
+import json
+import logging
+import os
+import secrets
+from dataclasses import asdict
+from pathlib import Path
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header
+
+from app.core import backup
+from app.core.context import get_cid
+from app.core.errors import ApiError
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+router = APIRouter(prefix="/admin")
+
+audit = logging.getLogger("app.audit")
+logger = logging.getLogger("app.api")
+
+
+def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    # Without a configured token the admin API does not exist.
+    if not ADMIN_TOKEN:
+        raise ApiError(code="not_found", message="not found", status=404)
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise ApiError(code="forbidden", message="admin token required", status=403)
+
+
+def _audit_backup(path: str, success: bool, cid: str | None) -> None:
+    audit.info(
+        json.dumps(
+            {
+                "action": "backup",
+                "path": path,
+                "success": success,
+                "correlation_id": cid,
+            },
+            ensure_ascii=False,
+        )
+    )
+
+
+def _run_backup(target: Path, compress: bool, cid: str | None) -> None:
+    try:
+        stats = backup.run_backup(target, compress=compress)
+    except Exception:
+        logger.exception("backup_failed", extra={"correlation_id": cid, "path": str(target)})
+        _audit_backup(str(target), False, cid)
+    else:
+        logger.info("backup_completed", extra={"correlation_id": cid, **asdict(stats)})
+        _audit_backup(stats.path, True, cid)
+    finally:
+        backup.backup_lock.release()
+
+
+@router.post("/backup", status_code=202, dependencies=[Depends(require_admin)])
+def create_backup(background_tasks: BackgroundTasks, compress: bool = True):
+    """Start a snapshot in the background; progress and result go to the logs."""
+    if not backup.backup_lock.acquire(blocking=False):
+        raise ApiError(code="backup_in_progress", message="a backup is already running", status=409)
+
+    target = backup.snapshot_path(compress)
+    background_tasks.add_task(_run_backup, target, compress, get_cid())
+    return {"status": "started", "path": str(target)}
@@ -6,11 +6,14 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
+from app import crud
 from app.core.context import get_cid
 from app.core.errors import ApiError
-from app.database import get_db
-from app.models import WishORM
-from app.schemas import WishIn, WishOut
+from app.core.price_index import PriceIndex, get_price_index
+from app.core.title_index import TitleIndex, get_title_index
+from app.database import get_db, unicode_lower
+from app.models import ArchivedWishORM, WishORM
+from app.schemas import WishIn, WishOut, WishSuggestion
 
 router = APIRouter(prefix="/wishes")
 
@@ -22,48 +25,119 @@ def _utcnow() -> str:
 
 
 MAX_SEARCH_QUERY_LENGTH = 100
+MAX_PRICE_FILTER_LIMIT = 1000
+MAX_SUGGEST_PREFIX_LENGTH = 50
+MAX_SUGGEST_LIMIT = 50
+FETCH_BATCH_SIZE = 500
 
 
-def _escape_like(value: str) -> str:
+def _escape_like_chars(value: str) -> str:
     value = value.replace("\\", "\\\\")
     value = value.replace("%", "\\%")
     value = value.replace("_", "\\_")
-    return f"%{value}%"
+    return value
+
+
+def _escape_like(value: str) -> str:
+    return f"%{_escape_like_chars(value)}%"
+
+
+def _escape_like_prefix(value: str) -> str:
+    return f"{_escape_like_chars(value)}%"
+
+
+def _price_below(db: Session, model, price_lt: Decimal, limit: int | None) -> list:
+    query = (
+        db.query(model)
+        .filter(model.price_estimate.isnot(None))
+        .filter(model.price_estimate < price_lt)
+        .order_by(model.price_estimate, model.id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def _fetch_by_ids(db: Session, ids: list[int]) -> list[WishORM]:
+    rows: dict[int, WishORM] = {}
+    for start in range(0, len(ids), FETCH_BATCH_SIZE):
+        batch = ids[start : start + FETCH_BATCH_SIZE]
+        for wish in db.query(WishORM).filter(WishORM.id.in_(batch)):
+            rows[wish.id] = wish
+    return [rows[wish_id] for wish_id in ids if wish_id in rows]
 
 
 @router.get("/search", response_model=list[WishOut])
 def search_wishes(
     q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH),
+    include_archived: bool = False,
     db: Session = Depends(get_db),
 ):
     pattern = _escape_like(q)
     result = db.query(WishORM).filter(WishORM.title.ilike(pattern, escape="\\")).all()
+    if include_archived:
+        result += (
+            db.query(ArchivedWishORM)
+            .filter(ArchivedWishORM.title.ilike(pattern, escape="\\"))
+            .all()
+        )
     return result
 
 
+@router.get("/suggest", response_model=list[WishSuggestion])
+def suggest_wishes(
+    prefix: str = Query(..., min_length=1, max_length=MAX_SUGGEST_PREFIX_LENGTH),
+    limit: int = Query(10, ge=1, le=MAX_SUGGEST_LIMIT),
+    db: Session = Depends(get_db),
+    index: TitleIndex | None = Depends(get_title_index),
+):
+    if index is not None:
+        return [{"id": wish_id, "title": title} for wish_id, title in index.suggest(prefix, limit)]
+
+    rows = (
+        db.query(WishORM.id, WishORM.title)
+        .filter(unicode_lower(WishORM.title).like(_escape_like_prefix(prefix.lower()), escape="\\"))
+        .order_by(unicode_lower(WishORM.title), WishORM.id)
+        .limit(limit)
+        .all()
+    )
+    return [{"id": wish_id, "title": title} for wish_id, title in rows]
+
+
 @router.get("/{wish_id}", response_model=WishOut)
-def get_wish(wish_id: int, db: Session = Depends(get_db)):
+def get_wish(wish_id: int, include_archived: bool = False, db: Session = Depends(get_db)):
     wish = db.get(WishORM, wish_id)
+    if not wish and include_archived:
+        wish = db.get(ArchivedWishORM, wish_id)
     if not wish:
         raise ApiError(code="not_found", message="wish doesn't exist", status=404)
     return wish
 
 
 @router.post("", status_code=201, response_model=WishOut)
-def create_wish(data: WishIn, db: Session = Depends(get_db)):
+def create_wish(
+    data: WishIn,
+    db: Session = Depends(get_db),
+    index: PriceIndex | None = Depends(get_price_index),
+    titles: TitleIndex | None = Depends(get_title_index),
+):
     if not data.title:
         raise ApiError(code="validation_error", message="title is required", status=422)
 
-    wish = WishORM(
-        title=data.title,
-        link=data.link,
-        price_estimate=data.price_estimate,
-        updated_at=_utcnow(),
-        notes=data.notes,
+    wish = crud.insert_wish(
+        db,
+        {
+            "title": data.title,
+            "link": data.link,
+            "price_estimate": data.price_estimate,
+            "updated_at": _utcnow(),
+            "notes": data.notes,
+        },
     )
-    db.add(wish)
-    db.commit()
-    db.refresh(wish)
+    if index is not None:
+        index.sync(db, wish.id)
+    if titles is not None:
+        titles.sync(db, wish.id)
 
     audit.info(
         json.dumps(
@@ -80,22 +154,25 @@ def create_wish(data: WishIn, db: Session = Depends(get_db)):
 
 
 @router.patch("/{wish_id}", response_model=WishOut)
-def edit_wish(wish_id: int, data: WishIn, db: Session = Depends(get_db)):
-    wish = db.get(WishORM, wish_id)
-    if not wish:
-        raise ApiError(code="not_found", message="wish doesn't exist", status=404)
-
+def edit_wish(
+    wish_id: int,
+    data: WishIn,
+    db: Session = Depends(get_db),
+    index: PriceIndex | None = Depends(get_price_index),
+    titles: TitleIndex | None = Depends(get_title_index),
+):
     updates = data.model_dump(exclude_unset=True)
 
     if "title" in updates and not updates["title"]:
         raise ApiError(code="validation_error", message="title can't be empty", status=422)
 
-    for field, value in updates.items():
-        setattr(wish, field, value)
-    wish.updated_at = _utcnow()
-
-    db.commit()
-    db.refresh(wish)
+    wish = crud.update_wish(db, wish_id, {**updates, "updated_at": _utcnow()})
+    if not wish:
+        raise ApiError(code="not_found", message="wish doesn't exist", status=404)
+    if index is not None:
+        index.sync(db, wish.id)
+    if titles is not None:
+        titles.sync(db, wish.id)
 
     audit.info(
         json.dumps(
@@ -112,19 +189,25 @@ def edit_wish(wish_id: int, data: WishIn, db: Session = Depends(get_db)):
 
 
 @router.delete("/{wish_id}", status_code=204)
-def delete_wish(wish_id: int, db: Session = Depends(get_db)):
-    wish = db.get(WishORM, wish_id)
-    if not wish:
+def delete_wish(
+    wish_id: int,
+    db: Session = Depends(get_db),
+    index: PriceIndex | None = Depends(get_price_index),
+    titles: TitleIndex | None = Depends(get_title_index),
+):
+    if not crud.delete_wish(db, wish_id):
         raise ApiError(code="not_found", message="wish doesn't exist", status=404)
 
-    db.delete(wish)
-    db.commit()
+    if index is not None:
+        index.sync(db, wish_id)
+    if titles is not None:
+        titles.sync(db, wish_id)
 
     audit.info(
         json.dumps(
             {
                 "action": "delete",
-                "wish_id": wish.id,
+                "wish_id": wish_id,
                 "success": True,
                 "correlation_id": get_cid(),
             },
@@ -135,11 +218,21 @@ def delete_wish(wish_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("", response_model=list[WishOut])
-def price_filter(price_lt: Decimal = Query(..., alias="price<"), db: Session = Depends(get_db)):
-    result = (
-        db.query(WishORM)
-        .filter(WishORM.price_estimate.isnot(None))
-        .filter(WishORM.price_estimate < price_lt)
-        .all()
-    )
+def price_filter(
+    price_lt: Decimal = Query(..., alias="price<"),
+    limit: int | None = Query(None, ge=1, le=MAX_PRICE_FILTER_LIMIT),
+    include_archived: bool = False,
+    db: Session = Depends(get_db),
+    index: PriceIndex | None = Depends(get_price_index),
+):
+    if index is not None:
+        result = _fetch_by_ids(db, index.ids_below(price_lt, limit))
+    else:
+        result = _price_below(db, WishORM, price_lt, limit)
+
+    if include_archived:
+        result = sorted(
+            result + _price_below(db, ArchivedWishORM, price_lt, limit),
+            key=lambda wish: (wish.price_estimate, wish.id),
+        )[:limit]
     return result
@@ -35,3 +35,8 @@ class WishOut(BaseModel):
     price_estimate: Decimal | None
     updated_at: str | None
     notes: str | None
+
+
+class WishSuggestion(BaseModel):
+    id: int
+    title: str
@@ -0,0 +1,106 @@
+"""Compare `price<` lookups through the SQL path and the in-memory price index.
+
+Usage: python -m bench.bench_price_index [--rows 1000000] [--queries 200] [--limit 50]
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.price_index import PriceIndex
+from app.database import Base
+from app.models import WishORM
+from app.routers.wishes import _fetch_by_ids
+
+CHUNK = 50_000
+
+
+def _seed(session_factory, rows: int) -> None:
+    rnd = random.Random(0)  # nosec B311 - synthetic benchmark data
+    with session_factory() as db:
+        for start in range(0, rows, CHUNK):
+            batch = [
+                {
+                    "title": f"wish {i}",
+                    "price_estimate": Decimal(rnd.randint(0, 100_000)) / 100,
+                    "updated_at": "2025-01-01T00:00:00Z",
+                }
+                for i in range(start, min(start + CHUNK, rows))
+            ]
+            db.execute(insert(WishORM), batch)
+        db.commit()
+
+
+def _sql_query(db, price_lt: Decimal, limit: int | None):
+    query = (
+        db.query(WishORM)
+        .filter(WishORM.price_estimate.isnot(None))
+        .filter(WishORM.price_estimate < price_lt)
+        .order_by(WishORM.price_estimate, WishORM.id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def _timed(fn, bounds) -> list[float]:
+    samples = []
+    for bound in bounds:
+        start = time.perf_counter()
+        fn(bound)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:<22} p50={statistics.median(samples):8.3f} ms  p99={p99:8.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.sqlite'}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        start = time.perf_counter()
+        _seed(session_factory, args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - start:.1f} s")
+
+        index = PriceIndex()
+        with session_factory() as db:
+            start = time.perf_counter()
+            index.rebuild(db)
+            print(f"index rebuild: {time.perf_counter() - start:.2f} s, {len(index)} entries")
+
+        rnd = random.Random(1)  # nosec B311 - synthetic benchmark data
+        bounds = [Decimal(rnd.randint(1, 100_000)) / 100 for _ in range(args.queries)]
+
+        with session_factory() as db:
+            _report("sql", _timed(lambda b: _sql_query(db, b, args.limit), bounds))
+            db.expunge_all()
+            _report("index ids", _timed(lambda b: index.ids_below(b, args.limit), bounds))
+            _report(
+                "index + batch fetch",
+                _timed(lambda b: _fetch_by_ids(db, index.ids_below(b, args.limit)), bounds),
+            )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Latency of /wishes/suggest lookups: SQL prefix scan vs the in-memory title index.
+
+Usage: python -m bench.bench_suggest [--rows 1000000] [--queries 1000] [--limit 10]
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.title_index import TitleIndex, get_title_index
+from app.database import Base, get_db
+from app.main import app
+from app.models import WishORM
+from bench.bench_price_index import CHUNK, _report, _timed
+
+_words_rnd = random.Random(2)  # nosec B311 - synthetic benchmark data
+WORDS = ["".join(_words_rnd.choices(string.ascii_lowercase, k=6)) for _ in range(5000)]
+
+
+def _seed(session_factory, rows: int) -> None:
+    rnd = random.Random(0)  # nosec B311 - synthetic benchmark data
+    with session_factory() as db:
+        for start in range(0, rows, CHUNK):
+            batch = [
+                {"title": " ".join(rnd.choices(WORDS, k=3)), "updated_at": "2025-01-01T00:00:00Z"}
+                for _ in range(start, min(start + CHUNK, rows))
+            ]
+            db.execute(insert(WishORM), batch)
+        db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{Path(tmp) / 'bench.sqlite'}", connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        start = time.perf_counter()
+        _seed(session_factory, args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - start:.1f} s")
+
+        index = TitleIndex()
+        with session_factory() as db:
+            start = time.perf_counter()
+            index.rebuild(db)
+            print(f"index rebuild: {time.perf_counter() - start:.2f} s, {len(index)} entries")
+
+        rnd = random.Random(1)  # nosec B311 - synthetic benchmark data
+        prefixes = [rnd.choice(WORDS)[: rnd.randint(1, 4)] for _ in range(args.queries)]
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        with TestClient(app) as client:
+
+            def request(prefix):
+                client.get("/wishes/suggest", params={"prefix": prefix, "limit": args.limit})
+
+            _report("endpoint sql", _timed(request, prefixes[: max(args.queries // 10, 1)]))
+            _report("index", _timed(lambda p: index.suggest(p, args.limit), prefixes))
+            app.dependency_overrides[get_title_index] = lambda: index
+            _report("endpoint index", _timed(request, prefixes))
+        app.dependency_overrides.clear()
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
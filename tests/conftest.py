@@ -40,3 +40,12 @@ def client():
         yield c
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def db_session(client):
+    """A session on the same in-memory database the `client` fixture serves."""
+    db_gen = app.dependency_overrides[_get_db]()
+    db = next(db_gen)
+    yield db
+    db_gen.close()
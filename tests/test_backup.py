@@ -0,0 +1,146 @@
+import gzip
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.core import backup
+from app.routers import admin
+
+
+def _make_db(path, rows=200):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE wishes (id INTEGER PRIMARY KEY, title TEXT)")
+    conn.executemany("INSERT INTO wishes (title) VALUES (?)", [(f"wish {i}",) for i in range(rows)])
+    conn.commit()
+    return conn
+
+
+def _count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT count(*) FROM wishes").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_backup_and_restore_roundtrip(tmp_path, compress):
+    source = _make_db(tmp_path / "live.sqlite")
+    suffix = ".sqlite.gz" if compress else ".sqlite"
+    snapshot = tmp_path / f"snap{suffix}"
+
+    stats = backup.backup_database(source, snapshot, compress=compress, pages=1, pause=0)
+    source.close()
+
+    assert stats.pages > 1
+    assert stats.size_bytes == snapshot.stat().st_size
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+    target = tmp_path / "fresh" / "app.sqlite"
+    assert backup.restore_database(snapshot, target) == stats.pages
+    assert _count(target) == 200
+
+
+def test_restore_refuses_to_overwrite(tmp_path):
+    _make_db(tmp_path / "live.sqlite").close()
+    _make_db(tmp_path / "existing.sqlite", rows=1).close()
+
+    with pytest.raises(FileExistsError):
+        backup.restore_database(tmp_path / "live.sqlite", tmp_path / "existing.sqlite")
+
+    backup.restore_database(tmp_path / "live.sqlite", tmp_path / "existing.sqlite", force=True)
+    assert _count(tmp_path / "existing.sqlite") == 200
+
+
+def test_restore_rejects_missing_snapshot(tmp_path):
+    target = tmp_path / "new.sqlite"
+
+    with pytest.raises(FileNotFoundError):
+        backup.restore_database(tmp_path / "typo.sqlite", target)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_restore_rejects_corrupt_gzip_and_cleans_up(tmp_path):
+    _make_db(tmp_path / "live.sqlite").close()
+    good = gzip.compress((tmp_path / "live.sqlite").read_bytes())
+    snapshot = tmp_path / "broken.sqlite.gz"
+    snapshot.write_bytes(good[: len(good) // 2])
+    target = tmp_path / "fresh" / "app.sqlite"
+
+    with pytest.raises(EOFError):
+        backup.restore_database(snapshot, target)
+
+    assert list((tmp_path / "fresh").iterdir()) == []
+
+
+def test_backup_endpoint_requires_admin_token(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path)
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", None)
+    assert client.post("/admin/backup").status_code == 404
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+    assert client.post("/admin/backup").status_code == 403
+    r = client.post("/admin/backup", headers={"X-Admin-Token": "wrong"})
+    assert r.status_code == 403
+    assert r.json()["error"]["code"] == "forbidden"
+
+
+def test_backup_endpoint_writes_snapshot_in_background(client, monkeypatch, tmp_path):
+    _make_db(tmp_path / "live.sqlite", rows=3).close()
+    monkeypatch.setattr(backup, "DB_PATH", tmp_path / "live.sqlite")
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path / "backups")
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+
+    r = client.post("/admin/backup", headers={"X-Admin-Token": "s3cret"})
+    assert r.status_code == 202
+    body = r.json()
+    assert body["status"] == "started"
+    assert body["path"].endswith(".sqlite.gz")
+    assert not backup.backup_lock.locked()
+
+    restored = tmp_path / "restored.sqlite"
+    backup.restore_database(Path(body["path"]), restored)
+    assert _count(restored) == 3
+
+
+def test_backup_endpoint_rejects_concurrent_backup(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path)
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+
+    with backup.backup_lock:
+        r = client.post("/admin/backup", headers={"X-Admin-Token": "s3cret"})
+    assert r.status_code == 409
+    assert r.json()["error"]["code"] == "backup_in_progress"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_backup_gives_up_on_timeout_and_cleans_up(tmp_path):
+    source = _make_db(tmp_path / "live.sqlite", rows=2000)
+    target = tmp_path / "out" / "snap.sqlite.gz"
+
+    with pytest.raises(TimeoutError):
+        backup.backup_database(source, target, compress=True, pages=1, pause=0, timeout=0)
+    source.close()
+
+    assert list((tmp_path / "out").iterdir()) == []
+
+
+def test_backup_gives_up_after_max_restarts(tmp_path, monkeypatch):
+    source = _make_db(tmp_path / "live.sqlite", rows=2000)
+    writer = sqlite3.connect(tmp_path / "live.sqlite")
+
+    def write_between_steps(_seconds):
+        # A write through another connection forces SQLite to restart the copy.
+        writer.execute("INSERT INTO wishes (title) VALUES ('busy')")
+        writer.commit()
+
+    monkeypatch.setattr(backup.time, "sleep", write_between_steps)
+    with pytest.raises(RuntimeError, match="restarted"):
+        backup.backup_database(source, tmp_path / "snap.sqlite", pages=5, pause=1, max_restarts=2)
+    writer.close()
+    source.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["live.sqlite"]
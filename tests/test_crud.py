@@ -0,0 +1,28 @@
+from app import crud
+
+
+def test_update_and_delete_report_missing_rows(db_session):
+    assert crud.update_wish(db_session, 404, {"title": "x"}) is None
+    assert crud.delete_wish(db_session, 404) is False
+
+
+def test_patch_changes_only_supplied_fields(client):
+    r = client.post("/wishes", json={"title": "Book", "notes": "hardcover", "price_estimate": "12"})
+    wish = r.json()
+
+    r = client.patch(f"/wishes/{wish['id']}", json={"price_estimate": "9.5"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["title"] == "Book"
+    assert body["notes"] == "hardcover"
+    assert body["price_estimate"] == "9.50"
+    assert client.get(f"/wishes/{wish['id']}").json() == body
+
+
+def test_delete_twice_returns_not_found(client):
+    wish_id = client.post("/wishes", json={"title": "Pen"}).json()["id"]
+
+    assert client.delete(f"/wishes/{wish_id}").status_code == 204
+    r = client.delete(f"/wishes/{wish_id}")
+    assert r.status_code == 404
+    assert r.json()["error"]["code"] == "not_found"
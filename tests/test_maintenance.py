@@ -0,0 +1,172 @@
+import sqlite3
+from datetime import timedelta
+
+from sqlalchemy import create_engine, delete, event, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.maintenance import archive_stale, compact, migrate_wishes_table
+from app.database import Base, init_db
+from app.models import ArchivedWishORM, WishORM
+
+STALE = "2000-01-01T00:00:00Z"
+
+# `wishes` as created before the archive tier existed.
+BASELINE_DDL = [
+    """CREATE TABLE wishes (
+        id INTEGER NOT NULL,
+        title VARCHAR(50) NOT NULL,
+        link VARCHAR,
+        price_estimate NUMERIC(10, 2),
+        updated_at VARCHAR,
+        notes TEXT,
+        PRIMARY KEY (id)
+    )""",
+    "CREATE INDEX ix_wishes_id ON wishes (id)",
+]
+
+
+def _archive_all(db):
+    db.execute(update(WishORM).values(updated_at=STALE))
+    db.commit()
+    return archive_stale(db, timedelta(days=30))
+
+
+def _baseline_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.sqlite'}")
+    with engine.begin() as conn:
+        for ddl in BASELINE_DDL:
+            conn.exec_driver_sql(ddl)
+        conn.execute(
+            insert(WishORM),
+            [{"title": "a", "updated_at": STALE}, {"title": "b", "updated_at": None}],
+        )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def test_archive_moves_stale_wishes_out_of_live_set(client, db_session):
+    r = client.post("/wishes", json={"title": "Old Lamp", "price_estimate": "5"})
+    wish_id = r.json()["id"]
+
+    assert _archive_all(db_session) == [wish_id]
+    fresh = client.post("/wishes", json={"title": "New Lamp", "price_estimate": "7"}).json()
+
+    assert client.get(f"/wishes/{wish_id}").status_code == 404
+    r = client.get(f"/wishes/{wish_id}", params={"include_archived": True})
+    assert r.status_code == 200
+    assert r.json()["title"] == "Old Lamp"
+
+    r = client.get("/wishes/search", params={"q": "Lamp"})
+    assert [w["id"] for w in r.json()] == [fresh["id"]]
+    r = client.get("/wishes/search", params={"q": "Lamp", "include_archived": True})
+    assert {w["id"] for w in r.json()} == {wish_id, fresh["id"]}
+
+    r = client.get("/wishes", params={"price<": "10", "include_archived": True, "limit": 1})
+    assert [w["id"] for w in r.json()] == [wish_id]
+
+
+def test_archive_keeps_recent_wishes(client, db_session):
+    client.post("/wishes", json={"title": "Recent"})
+
+    assert archive_stale(db_session, timedelta(days=30)) == []
+
+
+def test_archive_keeps_wish_edited_after_ids_were_picked(tmp_path):
+    path = tmp_path / "race.sqlite"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(WishORM),
+            [{"title": "edited", "updated_at": STALE}, {"title": "idle", "updated_at": STALE}],
+        )
+
+    edited = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def edit_before_delete(_conn, _cursor, statement, *_args):
+        if statement.startswith("DELETE") and not edited:
+            edited.append(True)
+            # A PATCH from another connection commits between id selection and the move.
+            writer = sqlite3.connect(path)
+            writer.execute("UPDATE wishes SET updated_at = '2999-01-01T00:00:00Z' WHERE id = 1")
+            writer.commit()
+            writer.close()
+
+    with sessionmaker(bind=engine)() as db:
+        assert archive_stale(db, timedelta(days=30)) == [2]
+        assert db.execute(select(WishORM.title)).scalars().all() == ["edited"]
+        assert db.execute(select(ArchivedWishORM.title)).scalars().all() == ["idle"]
+    engine.dispose()
+
+
+def test_migration_stops_id_reuse_after_archival(tmp_path):
+    engine = _baseline_engine(tmp_path)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as db:
+        db.execute(update(WishORM).where(WishORM.id == 2).values(updated_at=STALE))
+        db.commit()
+        assert archive_stale(db, timedelta(days=30)) == [1, 2]
+
+    assert migrate_wishes_table(engine) is True
+    assert migrate_wishes_table(engine) is False
+
+    with engine.begin() as conn:
+        new_id = conn.execute(insert(WishORM).values(title="c")).inserted_primary_key[0]
+        indexes = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'wishes'"
+        ).scalars()
+        assert {"ix_wishes_id", "ix_wishes_updated_at"} <= set(indexes)
+    assert new_id == 3
+    engine.dispose()
+
+
+def test_archive_skips_ids_already_in_archive(tmp_path):
+    engine = _baseline_engine(tmp_path)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as db:
+        assert archive_stale(db, timedelta(days=30)) == [1]
+        # Pre-migration schema: the freed id 1 is handed out again.
+        db.execute(delete(WishORM))
+        db.execute(insert(WishORM).values(title="reused", updated_at=STALE))
+        db.commit()
+        assert db.execute(select(WishORM.id)).scalar_one() == 1
+
+        assert archive_stale(db, timedelta(days=30)) == []
+        assert db.execute(select(WishORM.title)).scalar_one() == "reused"
+        assert db.execute(select(ArchivedWishORM.title)).scalar_one() == "a"
+    engine.dispose()
+
+
+def _auto_vacuum(engine):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+
+
+def test_init_db_enables_incremental_vacuum_only_on_new_files(tmp_path):
+    fresh = create_engine(f"sqlite:///{tmp_path / 'fresh.sqlite'}")
+    init_db(fresh)
+    assert _auto_vacuum(fresh) == 2
+    fresh.dispose()
+
+    existing = _baseline_engine(tmp_path)
+    init_db(existing)
+    assert _auto_vacuum(existing) == 0
+    existing.dispose()
+
+
+def test_compact_reports_reclaimed_space(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'compact.sqlite'}")
+    init_db(engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(WishORM), [{"title": "x", "notes": "n" * 2000}] * 500)
+    with engine.begin() as conn:
+        conn.execute(delete(WishORM))
+
+    stats = compact(engine)
+    assert stats.freed_pages > 0
+    assert stats.reclaimed_bytes > 0
+    engine.dispose()
@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import pytest
+
+from app.core.price_index import PriceIndex, get_price_index
+from app.main import app
+
+
+@pytest.fixture()
+def indexed_client(client):
+    index = PriceIndex()
+    app.dependency_overrides[get_price_index] = lambda: index
+    yield client
+
+
+def test_price_index_orders_by_price_then_id():
+    index = PriceIndex()
+    index.upsert(3, Decimal("5.00"))
+    index.upsert(1, Decimal("10.00"))
+    index.upsert(2, Decimal("5.00"))
+    index.upsert(4, None)
+
+    assert index.ids_below(Decimal("100")) == [2, 3, 1]
+    assert index.ids_below(Decimal("10.00")) == [2, 3]
+    assert index.ids_below(Decimal("10.001")) == [2, 3, 1]
+    assert index.ids_below(Decimal("100"), limit=1) == [2]
+    assert len(index) == 3
+
+
+def test_price_index_upsert_moves_and_discard_removes():
+    index = PriceIndex()
+    index.upsert(1, Decimal("1.00"))
+    index.upsert(2, Decimal("2.00"))
+
+    index.upsert(1, Decimal("3.00"))
+    assert index.ids_below(Decimal("100")) == [2, 1]
+
+    index.upsert(2, None)
+    index.discard(1)
+    index.discard(42)
+    assert index.ids_below(Decimal("100")) == []
+
+
+def test_price_filter_matches_sql_path(client, db_session):
+    prices = ["10.00", "2.50", None, "7.99", "2.50"]
+    for i, price in enumerate(prices):
+        r = client.post("/wishes", json={"title": f"wish {i}", "price_estimate": price})
+        assert r.status_code == 201
+
+    sql = client.get("/wishes", params={"price<": "8"}).json()
+
+    index = PriceIndex()
+    index.rebuild(db_session)
+    app.dependency_overrides[get_price_index] = lambda: index
+
+    indexed = client.get("/wishes", params={"price<": "8"}).json()
+    assert [w["id"] for w in indexed] == [w["id"] for w in sql]
+    assert [w["price_estimate"] for w in indexed] == ["2.50", "2.50", "7.99"]
+
+
+def test_price_index_sync_uses_committed_row(client, db_session):
+    wish_id = client.post("/wishes", json={"title": "Lamp", "price_estimate": "30"}).json()["id"]
+    index = PriceIndex()
+    # A late update carrying an older price is corrected by the committed value.
+    index.upsert(wish_id, Decimal("1.00"))
+    index.sync(db_session, wish_id)
+    assert index.ids_below(Decimal("10")) == []
+    assert index.ids_below(Decimal("31")) == [wish_id]
+
+    client.delete(f"/wishes/{wish_id}")
+    index.sync(db_session, wish_id)
+    assert len(index) == 0
+
+
+def test_price_filter_tracks_writes(indexed_client):
+    r = indexed_client.post("/wishes", json={"title": "Cheap", "price_estimate": "1"})
+    cheap_id = r.json()["id"]
+    r = indexed_client.post("/wishes", json={"title": "Pricey", "price_estimate": "50"})
+    pricey_id = r.json()["id"]
+
+    r = indexed_client.get("/wishes", params={"price<": "10"})
+    assert [w["id"] for w in r.json()] == [cheap_id]
+
+    indexed_client.patch(f"/wishes/{pricey_id}", json={"price_estimate": "5"})
+    r = indexed_client.get("/wishes", params={"price<": "10", "limit": 1})
+    assert [w["id"] for w in r.json()] == [cheap_id]
+
+    indexed_client.delete(f"/wishes/{cheap_id}")
+    r = indexed_client.get("/wishes", params={"price<": "10"})
+    assert [w["title"] for w in r.json()] == ["Pricey"]
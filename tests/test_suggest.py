@@ -0,0 +1,83 @@
+import pytest
+
+from app.core.title_index import TitleIndex, get_title_index
+from app.main import app
+
+
+@pytest.fixture(params=["sql", "index"])
+def suggest_client(request, client):
+    if request.param == "index":
+        index = TitleIndex()
+        app.dependency_overrides[get_title_index] = lambda: index
+    yield client
+
+
+def test_title_index_prefix_lookup():
+    index = TitleIndex()
+    index.upsert(1, "Nintendo Switch")
+    index.upsert(2, "nintendo DS")
+    index.upsert(3, "PlayStation 5")
+
+    assert index.suggest("nin", 10) == [(2, "nintendo DS"), (1, "Nintendo Switch")]
+    assert index.suggest("NINTENDO S", 10) == [(1, "Nintendo Switch")]
+    assert index.suggest("nin", 1) == [(2, "nintendo DS")]
+    assert index.suggest("xbox", 10) == []
+
+    index.upsert(2, "Game Boy")
+    index.discard(3)
+    assert index.suggest("nin", 10) == [(1, "Nintendo Switch")]
+    assert index.suggest("p", 10) == []
+    assert len(index) == 2
+
+
+def test_suggest_returns_matching_titles(suggest_client):
+    for title in ["Nintendo Switch", "nintendo DS", "PlayStation 5", "50% off"]:
+        assert suggest_client.post("/wishes", json={"title": title}).status_code == 201
+
+    r = suggest_client.get("/wishes/suggest", params={"prefix": "Nin"})
+    assert r.status_code == 200
+    assert [s["title"] for s in r.json()] == ["nintendo DS", "Nintendo Switch"]
+    assert set(r.json()[0]) == {"id", "title"}
+
+    r = suggest_client.get("/wishes/suggest", params={"prefix": "nin", "limit": 1})
+    assert [s["title"] for s in r.json()] == ["nintendo DS"]
+
+    r = suggest_client.get("/wishes/suggest", params={"prefix": "%"})
+    assert r.json() == []
+
+
+def test_suggest_tracks_writes(suggest_client):
+    wish_id = suggest_client.post("/wishes", json={"title": "Kindle"}).json()["id"]
+    suggest_client.patch(f"/wishes/{wish_id}", json={"title": "Kobo"})
+    assert suggest_client.get("/wishes/suggest", params={"prefix": "Kin"}).json() == []
+    assert suggest_client.get("/wishes/suggest", params={"prefix": "Ko"}).json() == [
+        {"id": wish_id, "title": "Kobo"}
+    ]
+
+    suggest_client.delete(f"/wishes/{wish_id}")
+    assert suggest_client.get("/wishes/suggest", params={"prefix": "Ko"}).json() == []
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        ("нин", ["Нинтендо", "нинтендо DS"]),
+        ("НИНТЕНДО d", ["нинтендо DS"]),
+        ("straß", ["Straße"]),
+        ("strass", []),
+    ],
+)
+def test_suggest_folds_non_ascii_case_on_both_paths(suggest_client, prefix, expected):
+    for title in ["нинтендо DS", "Нинтендо", "Straße"]:
+        assert suggest_client.post("/wishes", json={"title": title}).status_code == 201
+
+    r = suggest_client.get("/wishes/suggest", params={"prefix": prefix})
+    assert r.status_code == 200
+    assert [s["title"] for s in r.json()] == expected
+
+
+@pytest.mark.parametrize(
+    "params", [{"prefix": ""}, {"prefix": "x" * 51}, {"prefix": "a", "limit": 0}]
+)
+def test_suggest_rejects_invalid_params(client, params):
+    assert client.get("/wishes/suggest", params=params).status_code == 422